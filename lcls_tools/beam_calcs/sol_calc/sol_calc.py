@@ -1,4 +1,3 @@
-import sys
 import scipy.constants as sc
 import numpy as np
 from numpy.linalg import pinv
@@ -24,6 +23,13 @@ from math import sin, cos, sqrt
 # error or None.  This will be fixed when I care enough to fix it
 
 class SolCalc(object):
+    # Fixed transfer matrix entries for the offset terms, same for every
+    # measurement so they live on the class rather than being recomputed
+    X5 = 1
+    X6 = 0
+    Y5 = 0
+    Y6 = 1
+
     def __init__(self, l, e_gun, d):
         self._l = l  # Leff
         self._e_gun = e_gun  # MeV
@@ -110,14 +116,6 @@ class SolCalc(object):
         """fourth term, x"""
         return self._s**2*(1/self._K) + self._d*self._s*self._c
 
-    def x5(self):
-        """Default"""
-        return 1
-
-    def x6(self):
-        """Default"""
-        return 0
-
     def y1(self):
         """first term y"""
         return -self._s*self._c + self._d*self._K*self._s**2
@@ -134,14 +132,6 @@ class SolCalc(object):
         """fourth term y"""
         return (self._s*self._c*(1/self._K) + self._d*self._c**2)
 
-    def y5(self):
-        """Default"""
-        return 0
-    
-    def y6(self):
-        """Default"""
-        return 1
-
     def _calc_props(self, b):
         """Update all the properties
         b (float): magnetic field in kG
@@ -178,8 +168,8 @@ class SolCalc(object):
               self.x2(), 
               self.x3(), 
               self.x4(), 
-              self.x5(), 
-              self.x6()])
+              self.X5, 
+              self.X6])
         
         return  arr
 
@@ -190,8 +180,8 @@ class SolCalc(object):
               self.y2(), 
               self.y3(), 
               self.y4(), 
-              self.y5(), 
-              self.y6()])
+              self.Y5, 
+              self.Y6])
 
         return arr
 
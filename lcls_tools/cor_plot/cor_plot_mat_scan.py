@@ -30,6 +30,7 @@ class CorPlotMatScan(object):
             data = sio.loadmat(mat_file)['data'][0][0]
             self._file = mat_file
             self._fields = data.dtype.names
+            self._field_idx = {name: i for i, name in enumerate(self._fields)}
             self._accel = self._unpack_accl(data)
             self._statuses = self._unpack_statuses(data)
             self._ctrl_dict = self._unpack_ctrl_pv(data)
@@ -119,30 +120,27 @@ class CorPlotMatScan(object):
     def _unpack_accl(self, data):
         """Accelerator name such as LCLS, LCLS2, etc..."""
         # Need to write generic decorator for this behavior
-        if ACCL not in self._fields:
+        if ACCL not in self._field_idx:
             return None
 
-        idx = self._fields.index(ACCL)
-        return str(data[idx][0])
+        return str(data[self._field_idx[ACCL]][0])
 
     def _unpack_statuses(self, data):
         """Pull statuses out of the nested array"""
-        if STAT not in self._fields:
+        if STAT not in self._field_idx:
             return None
 
-        idx = self._fields.index(STAT)
-        statuses = data[idx]
+        statuses = data[self._field_idx[STAT]]
         return [status[0] for status in statuses]
 
     def _unpack_ctrl_pv(self, data):
         """Produces a list of ctrl pv dicts with list of vals and 
         tmestamps.
         """
-        if CTRL not in self._fields:
+        if CTRL not in self._field_idx:
             return None
 
-        idx = self._fields.index(CTRL)
-        ctrls = data[idx]
+        ctrls = data[self._field_idx[CTRL]]
         ctrl_list = []
         for ctrl in ctrls:
             temp = dict()
@@ -160,11 +158,10 @@ class CorPlotMatScan(object):
         """Create a list of dictionaries for all the readback pvs
         Each val and time key is a 2 d array for each data point as each point
         has a number of readings"""
-        if READ not in self._fields:
+        if READ not in self._field_idx:
             return None
 
-        idx = self._fields.index(READ)
-        pvs = data[idx]
+        pvs = data[self._field_idx[READ]]
         read = []
         for pv in pvs:  # FML
             temp = dict()
@@ -183,11 +180,10 @@ class CorPlotMatScan(object):
         The value is a list of samples, each sample being a dict with
         the appropriate key for the data (provided by dtype names).  I'm leaving
         the business logic of extracting these to @property calls"""
-        if BEAM not in self._fields:
+        if BEAM not in self._field_idx:
             return None, None
 
-        idx = self._fields.index(BEAM)
-        beam = data[idx]
+        beam = data[self._field_idx[BEAM]]
         names = beam.dtype.names
         beams = dict()
         for i, iteration in enumerate(beam):  # List of iterations
@@ -201,11 +197,10 @@ class CorPlotMatScan(object):
         reformatting, but it's just a list of PV data lists.  The PV
         data list contains a list of iterations, each iteration contains
         samples"""
-        if PROF not in self._fields:
+        if PROF not in self._field_idx:
             return None
 
-        idx = self._fields.index(PROF)
-        prof = data[idx]
+        prof = data[self._field_idx[PROF]]
         names = prof.dtype.names
         prof_pvs = dict()
         for pv in prof:
@@ -218,22 +213,20 @@ class CorPlotMatScan(object):
 
     def _unpack_ts(self, data):
         """Unpack the timestamp, datetime.fromordinal not in current version"""
-        if TS not in self._fields:
+        if TS not in self._field_idx:
             return None
 
-        idx = self._fields.index(TS)
-        ts = data[idx][0][0]
+        ts = data[self._field_idx[TS]][0][0]
         
         return ts
 
     def _unpack_config(self, data):
         """As far as I can tell this is not useful except for ctrl pv,
         but we get that with control dict"""
-        if CONFIG not in self._fields:
+        if CONFIG not in self._field_idx:
             return None
 
-        idx = self._fields.index(CONFIG)
-        config = data[idx]
+        config = data[self._field_idx[CONFIG]]
 
         return config
 
@@ -1,3 +1,4 @@
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 import json
 # from typing import List, Dict, Union
@@ -17,11 +18,17 @@ RANGE_RESULT_SUFFIX = "getData.json"
 
 TIMEOUT = 3
 
+# Concurrent range requests per getValuesOverTimeRange call
+MAX_WORKERS = 8
+
 
 class Archiver(object):
     def __init__(self, machine):
         # type: (str) -> None
         self.url_formatter = ARCHIVER_URL_FORMATTER.format(MACHINE=machine)
+        # One session for all requests so every call reuses the same
+        # pooled TCP connection instead of opening a new one
+        self.session = requests.Session()
 
     def getDataAtTime(self, pvList, timeRequested):
         # type: (List[str], datetime) -> Dict[str, str]
@@ -29,8 +36,8 @@ class Archiver(object):
         suffix = SINGLE_RESULT_SUFFIX.format(TIME=timeRequested.isoformat())
         url = self.url_formatter.format(SUFFIX=suffix)
 
-        response = requests.post(url=url, data={"pv": ",".join(pvList)},
-                                 timeout=TIMEOUT)
+        response = self.session.post(url=url, data={"pv": ",".join(pvList)},
+                                     timeout=TIMEOUT)
 
         results = {}
 
@@ -67,33 +74,45 @@ class Archiver(object):
         if timeDelta:
             return self.getDataWithTimeInterval(pvList, startTime, endTime, timeDelta)
         else:
-            url = self.url_formatter.format(SUFFIX=RANGE_RESULT_SUFFIX)
+            # The appliance only takes one PV per range request, but the
+            # requests are independent so we can at least issue them
+            # concurrently instead of serializing the round-trips
+            with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+                futures = [(pv, executor.submit(self.getDataOverRange, pv,
+                                                startTime, endTime))
+                           for pv in pvList]
 
             results = {}
+            for pv, future in futures:
+                result = future.result()
+                if result is not None:
+                    results[pv] = result
 
-            # TODO figure out how to send all PVs at once
-            for pv in pvList:
+            return results
 
-                response = requests.get(url=url, timeout=TIMEOUT,
-                                        params={"pv": pv,
-                                                "from": startTime.isoformat() + "-07:00",
-                                                "to": endTime.isoformat() + "-07:00"})
+    def getDataOverRange(self, pv, startTime, endTime):
+        # type: (str, datetime, datetime) -> Dict[str, List[Union[datetime, str]]]
+        url = self.url_formatter.format(SUFFIX=RANGE_RESULT_SUFFIX)
 
-                try:
-                    jsonData = json.loads(response.text)
-                    # It returns a list of len 1 for some godforsaken reason...
-                    element = jsonData.pop()
-                    result = {"times": [], "values": []}
-                    for datum in element[u'data']:
-                        result["times"].append(datum[u'secs'])
-                        result["values"].append(datum[u'val'])
+        response = self.session.get(url=url, timeout=TIMEOUT,
+                                    params={"pv": pv,
+                                            "from": startTime.isoformat() + "-07:00",
+                                            "to": endTime.isoformat() + "-07:00"})
 
-                    results[pv] = result
+        try:
+            jsonData = json.loads(response.text)
+            # It returns a list of len 1 for some godforsaken reason...
+            element = jsonData.pop()
+            result = {"times": [], "values": []}
+            for datum in element[u'data']:
+                result["times"].append(datum[u'secs'])
+                result["values"].append(datum[u'val'])
 
-                except ValueError:
-                    print("JSON error with {PVS}".format(PVS=pvList))
+            return result
 
-            return results
+        except ValueError:
+            print("JSON error with {PV}".format(PV=pv))
+            return None
 
 
 class Tester(TestCase):
@@ -156,7 +175,7 @@ class Tester(TestCase):
         def __init__(self):
             self.text = ""
 
-    @mock.patch("requests.post")
+    @mock.patch("requests.Session.post")
     @mock.patch("json.loads")
     def testGetDataAtTimeMockedData(self, mockedLoads, mockedPost):
 
@@ -1,20 +1,44 @@
 #!/usr/local/lcls/package/python/current/bin/python
 
-import epics
+from concurrent.futures import ThreadPoolExecutor
 from epics import PV
 import magnet_constants as mc
-from inspect import getmembers
-from threading import Thread
-from time import sleep
+
+# Cap on how long a blocking channel access read can hang
+GET_TIMEOUT = 1.0
 
 def get_magnets():
     """Return MAD names of all magenets that have models"""
-    return mc.MAGNETS.keys()
+    return sorted(mc.MAGNETS)
+
+def get_magnet_pvnames(name):
+    """Return the pvname strings for a magnet without creating PV objects,
+    for callers that only want names (archiver lookups, displays)"""
+    if name not in mc.MAGNETS:
+        print('You have not specified a valid magnet')
+        return []
+
+    mag_dict = mc.MAGNETS[name]
+    return [mag_dict[field] for field in ('bctrl', 'bact', 'bdes', 'bcon', 'ctrl')]
 
 class Magnet(object):
     """Magnet control"""
+    __slots__ = (
+        '_name',
+        '_bctrl',
+        '_bact',
+        '_bdes',
+        '_bcon',
+        '_ctrl',
+        '_tol',
+        '_length',
+        '_ctrl_vars',
+        '_ctrl_state',
+        '_pv_attrs',
+    )
+
     def __init__(self, name='SOL1B'):
-        if name not in mc.MAGNETS.keys():
+        if name not in mc.MAGNETS:
             raise ValueError('You have not specified a valid magnet')
         mag_dict = mc.MAGNETS[name]
         self._name = name
@@ -25,9 +49,23 @@ class Magnet(object):
         self._ctrl = PV(mag_dict['ctrl'])
         self._tol = mag_dict['tol']
         self._length = mag_dict['length']
-        self._ctrl_vars = self._ctrl.get_ctrlvars()['enum_strs']
+        self._ctrl_vars = None  # Fetched on first use, not at construction
+        self._ctrl_state = None
+        self._ctrl.add_callback(self._ctrl_clbk, with_ctrlvars=False)
         self._pv_attrs = self.find_pv_attrs()
 
+    def _enum_vars(self):
+        """Enum strings for the ctrl PV, fetched on first use so building
+        a Magnet does not block on channel access"""
+        if self._ctrl_vars is None:
+            self._ctrl_vars = self._ctrl.get_ctrlvars()['enum_strs']
+
+        return self._ctrl_vars
+
+    def _ctrl_clbk(self, pvname=None, value=None, char_value=None, **kw):
+        """Keep track of the current ctrl state from the monitor"""
+        self._ctrl_state = value
+
     def check_state(f):
         """Decorator to only allow transitions in 'Ready' state"""
         def decorated(self, *args, **kwargs):
@@ -45,14 +83,14 @@ class Magnet(object):
     @property
     def bctrl(self):
         """Get BCTRL value"""
-        return self._bctrl.get()
+        return self._bctrl.get(timeout=GET_TIMEOUT)
 
     @bctrl.setter
     @check_state
     def bctrl(self, val):
         """Set bctrl value"""
-        if not isinstance(val, float) or isinstance(val, int):
-            print('you need to provide an in or float')
+        if not isinstance(val, (int, float)):
+            print('you need to provide an int or float')
             return
 
         self._bctrl.put(val)
@@ -60,17 +98,24 @@ class Magnet(object):
     @property
     def bact(self):
         """Get the BACT value"""
-        return self._bact.get()
+        return self._bact.get(timeout=GET_TIMEOUT)
 
     @property
     def bdes(self):
         """Get BDES value"""
-        return self._bdes.get()
+        return self._bdes.get(timeout=GET_TIMEOUT)
 
     @property
     def ctrl_value(self):
         """Get the current action on magnet"""
-        return self._ctrl_vars[self._ctrl.get()]
+        if self._ctrl_state is None:
+            self._ctrl_state = self._ctrl.get(timeout=GET_TIMEOUT)
+
+        if self._ctrl_state is None:
+            print('could not read ctrl state, channel timed out')
+            return None
+
+        return self._enum_vars()[self._ctrl_state]
 
     @property
     def length(self):
@@ -89,7 +134,7 @@ class Magnet(object):
     @property
     def pv_props(self):
         """All the properties that are PV objects/can have callbacks"""
-        return self._pv_props
+        return self._pv_attrs
 
     @property
     def tol(self):
@@ -149,12 +194,21 @@ class Magnet(object):
         """Reset magnet"""
         self._ctrl.put(mc.CTRL.index('RESET'))
 
+    def connect(self, timeout=1.0):
+        """Wait for all the PVs to connect, in parallel so the total wait
+        is one search round trip instead of one per PV"""
+        pvs = [getattr(self, attr) for attr in self._pv_attrs]
+        with ThreadPoolExecutor(max_workers=len(pvs)) as executor:
+            results = executor.map(lambda pv: pv.wait_for_connection(timeout), pvs)
+
+        return all(results)
+
     def find_pv_attrs(self):
         """Get all the PV object attributes"""
         pv_attrs = []
-        for mem in getmembers(self):
-            if len(mem) > 1 and isinstance(mem[1], PV):
-                pv_attrs.append(mem[0])
+        for name in sorted(self.__slots__):
+            if isinstance(getattr(self, name, None), PV):
+                pv_attrs.append(name)
 
         return pv_attrs
 
@@ -166,14 +220,14 @@ class Magnet(object):
             print('this attribute is not a pv object, ignored')
             return
 
-        fns = [val[0] for val in getattr(self, attr).callbacks.values()]
-
-        if fn in fns:
-            print('this is a duplicate callback assignment, ignored')
-            return
+        pv = getattr(self, attr)
+        for val in pv.callbacks.values():
+            if val[0] == fn:
+                print('this is a duplicate callback assignment, ignored')
+                return
 
-        print('adding callback {0}'.format(fn))
-        getattr(self, attr).add_callback(fn, with_ctrlvars=False)
+        print(f'adding callback {fn}')
+        pv.add_callback(fn, with_ctrlvars=False)
 
     def remove_clbk(self, fn, attr='_bact'):
         """Add a callback function to a given attribute"""
@@ -181,16 +235,18 @@ class Magnet(object):
             print('this attribute is not a pv object, ignored')
             return
 
+        pv = getattr(self, attr)
         index = None
-        for k, v in getattr(self, attr).callbacks.items():
+        for k, v in pv.callbacks.items():
             if v[0] == fn:
                 index = k
+                break
 
-        if not index:
+        if index is None:
             print('function not found in callbacks, ignored')
             return
 
-        print('remvong callback {0}'.format(fn))
-        getattr(self, attr).remove_callback(index=index)
+        print(f'removing callback {fn}')
+        pv.remove_callback(index=index)
 
         
@@ -1,46 +1,110 @@
 #!/usr/local/lcls/package/python/current/bin/python
 
+from concurrent.futures import ThreadPoolExecutor
+from threading import Timer
 from epics import PV
 import profmon_constants as pc
-from inspect import getmembers
-from time import sleep
-from threading import Thread
-from numpy import array_equal
-from functools import partial
+
+# Cap on how long a blocking channel access read can hang
+GET_TIMEOUT = 1.0
+
+# Shared pool for user callbacks so they run off the channel access
+# monitor thread and a slow one cannot stall PV updates
+USER_CLBK_POOL = ThreadPoolExecutor(max_workers=4)
 
 # Implementation needs to be thought out, just a POC
 
 def get_profile_monitors():
     """Return MAD names of all profile monitors that have models"""
-    return sorted(pc.PROFS.keys())
+    return sorted(pc.PROFS)
+
+def get_profmon_pvnames(prof_name):
+    """Return the pvname strings for a profile monitor without creating PV
+    objects, for callers that only want names (archiver lookups, displays)"""
+    if prof_name not in pc.PROFS:
+        print('You have not specified a valid profile monitor')
+        return []
+
+    return list(pc.PROFS[prof_name].values())
 
 class ProfMon(object):
     """Generic Profile Monitor Object Class that references profile monitor MAD name"""
+    __slots__ = (
+        '_prof_name',
+        '_prof_set',
+        '_prof_get',
+        '_prof_image',
+        '_prof_res',
+        '_x_size',
+        '_y_size',
+        '_rate',
+        '_images',
+        '_images_to_collect',
+        '_images_requested',
+        '_collection_wait',
+        '_collection_timer',
+        '_discard_first',
+        '_acquire_clbk',
+        '_gathering_data',
+        '_get_vars',
+        '_set_vars',
+        '_motion_state',
+        '_insert_clbk',
+        '_extract_clbk',
+    )
+
     def __init__(self, prof_name='OTR02'):
-        if prof_name not in pc.PROFS.keys():
+        if prof_name not in pc.PROFS:
             raise ValueError('You have not specified a valid profile monitor')
         prof_dict = pc.PROFS[prof_name]
         self._prof_name = prof_name
         self._prof_set = PV(prof_dict['set'])
         self._prof_get = PV(prof_dict['get'])
-        self._prof_image = PV(prof_dict['image'])
+        # No monitor on the image waveform; it is large and only wanted
+        # on demand
+        self._prof_image = PV(prof_dict['image'], auto_monitor=False)
         self._prof_res = PV(prof_dict['res'])
         self._x_size = PV(prof_dict['xsize'])
         self._y_size = PV(prof_dict['ysize'])
         self._rate = PV(prof_dict['rate'])
         self._images = []
-        self._data_thread = None
+        self._images_to_collect = 0
+        self._images_requested = 0
+        self._collection_wait = 0
+        self._collection_timer = None
+        self._discard_first = False
+        self._acquire_clbk = None
         self._gathering_data = False
-        self._get_vars = self._prof_get.get_ctrlvars()['enum_strs']
-        self._set_vars = self._prof_set.get_ctrlvars()['enum_strs']
-        self._motion_state = self._get_vars[self._prof_get.get()]
+        self._get_vars = None  # Fetched on first use, not at construction
+        self._set_vars = None
+        self._motion_state = None
         self._prof_get.add_callback(self._state_clbk, index=1)
         self._insert_clbk = None
         self._extract_clbk = None
 
+    def connect(self, timeout=1.0):
+        """Wait for all the PVs to connect, in parallel so the total wait
+        is one search round trip instead of one per PV"""
+        pvs = [getattr(self, attr) for attr in self.__slots__
+               if isinstance(getattr(self, attr), PV)]
+        with ThreadPoolExecutor(max_workers=len(pvs)) as executor:
+            results = executor.map(lambda pv: pv.wait_for_connection(timeout), pvs)
+
+        return all(results)
+
+    def _state_vars(self):
+        """Enum strings for the state readback, fetched on first use so
+        building a ProfMon does not block on channel access"""
+        if self._get_vars is None:
+            self._get_vars = self._prof_get.get_ctrlvars()['enum_strs']
+
+        return self._get_vars
+
     def _state_clbk(self, pvName=None, value=None, char_value=None, **kw):
-        """Keep track of position/motion state"""
-        self._motion_state = self._get_vars[value]
+        """Keep track of position/motion state.  Stores the raw value only;
+        mapping it through _state_vars could issue a CA read and this runs
+        in the monitor thread"""
+        self._motion_state = value
 
     @property
     def prof_name(self):
@@ -50,7 +114,7 @@ class ProfMon(object):
     @property
     def cur_image(self):
         """Get the current image array"""
-        return self._prof_image.get()
+        return self._prof_image.get(timeout=GET_TIMEOUT)
 
     @property
     def saved_images(self):
@@ -60,32 +124,45 @@ class ProfMon(object):
     @property
     def resolution(self):
         """Get the resolution"""
-        return self._prof_res.get()
+        return self._prof_res.get(timeout=GET_TIMEOUT)
 
     @property
     def arr_dims(self):
-        """Get the x and y dimensions"""
-        return (self._x_size.get(), self._y_size.get())
+        """Get the x and y dimensions, served from the monitor cache"""
+        return (self._x_size.get(timeout=GET_TIMEOUT),
+                self._y_size.get(timeout=GET_TIMEOUT))
 
     @property
     def rate(self):
         """Get the current rate"""
-        return self._rate.get()
+        return self._rate.get(timeout=GET_TIMEOUT)
 
     @property
     def motion_state(self):
         """Get the current motion state of the profile monitor"""
-        return self._motion_state
+        if self._motion_state is None:
+            self._motion_state = self._prof_get.get(timeout=GET_TIMEOUT)
+
+        if self._motion_state is None:
+            print(f'{self._prof_name}: could not read state, channel timed out')
+            return None
+
+        return self._state_vars()[self._motion_state]
 
     @property
     def state(self):
         """Get the overall state of the profile monitor"""
-        return self.__dict__
+        return {attr: getattr(self, attr) for attr in self.__slots__}
 
     def insert(self, user_clbk=None):
         """Generic call to insert profile monitor, can specify callback to be run"""
-        if self._motion_state == pc.IN:
-            print('{0}: {1}'.format(self._prof_name, pc.ALREADY_INSERTED))
+        state = self.motion_state
+        if state is None:
+            print(f'{self._prof_name}: state unavailable, not inserting')
+            return
+
+        if state == pc.IN:
+            print(f'{self._prof_name}: {pc.ALREADY_INSERTED}')
             return
 
         if user_clbk:
@@ -95,20 +172,27 @@ class ProfMon(object):
         self._prof_set.put(pc.IN)
 
     def _inserted(self, pv_name=None, value=None, char_value=None, **kw):
-        """Generic callback after profile monitor has been inserted, default"""
-        if self._get_vars[value] == pc.IN:
-            print('{0}: {1}'.format(self._prof_name, pc.INSERTED))
+        """Generic callback after profile monitor has been inserted, default.
+        insert reads motion_state first, so the enum table is already cached
+        and this is a local lookup, safe in the monitor thread"""
+        if self._get_vars and self._get_vars[value] == pc.IN:
+            print(f'{self._prof_name}: {pc.INSERTED}')
 
             if self._insert_clbk:
-                self._insert_clbk()
+                USER_CLBK_POOL.submit(self._insert_clbk)
                 self._insert_clbk = None
 
             self._prof_get.remove_callback(index=0)
     
-    def extract(self, usr_clbk=None):
-        """Extract profile monitor command, can specify callback to be run"""        
-        if self._motion_state == pc.OUT:
-            print('{0}: {1}'.format(self._prof_name, pc.ALREADY_EXTRACTED))
+    def extract(self, user_clbk=None):
+        """Extract profile monitor command, can specify callback to be run"""
+        state = self.motion_state
+        if state is None:
+            print(f'{self._prof_name}: state unavailable, not extracting')
+            return
+
+        if state == pc.OUT:
+            print(f'{self._prof_name}: {pc.ALREADY_EXTRACTED}')
             return
 
         if user_clbk:
@@ -118,35 +202,88 @@ class ProfMon(object):
         self._prof_set.put(pc.OUT)
         
     def _extracted(self, pv_name=None, value=None, char_value=None, **kw):
-        """Generic Callback for profile monitor that has been extracted, default"""
-        if self._get_vars[value] == pc.OUT:
-            print('{0}: {1}'.format(self._prof_name, pc.EXTRACTED))
+        """Generic Callback for profile monitor that has been extracted, default.
+        extract reads motion_state first, so the enum table is already cached
+        and this is a local lookup, safe in the monitor thread"""
+        if self._get_vars and self._get_vars[value] == pc.OUT:
+            print(f'{self._prof_name}: {pc.EXTRACTED}')
 
             if self._extract_clbk:
-                self._extract_clbk()
+                USER_CLBK_POOL.submit(self._extract_clbk)
                 self._extract_clbk = None
 
             self._prof_get.remove_callback(index=0)
 
-    def acquire_images(self, images=1):
-        """Start the thread"""
-        self._data_thread = Thread(target=self._collect_image_data, args=(images,))
-        self._data_thread.start()
+    def acquire_images(self, images=1, callback=None):
+        """Collect images from the monitor, can specify callback to be run
+        once all of them have arrived"""
+        if self._gathering_data:
+            print(f'{self._prof_name}: still gathering previous request, ignored')
+            return
+
+        if images < 1:
+            print(f'{self._prof_name}: must request at least one image, ignored')
+            return
 
-    def _collect_image_data(self, images, callback):
-        """Threaded data collection"""
         self._gathering_data = True
-        delay = 1.0 / self._rate.get()  # Rate must be in Hz
-        i = 0
-        while i < images:
-            image = self._prof_image.get()
-            if len(self._images) > 0 and array_equal(image, self._images[-1]):
-                sleep(0.01)
-            else:
-                self._images.append(image)
-                sleep(delay)
-                i += 1
-        if callback:  # Would want this to be pyqtSignal or Event notification type thing
-            callback()
+        self._images_to_collect = images
+        self._images_requested = images
+        self._discard_first = True
+        self._acquire_clbk = callback
+
+        # Bound the wait between frames so a camera that stops publishing
+        # cannot leave the collection armed forever
+        rate = self._rate.get(timeout=GET_TIMEOUT)
+        self._collection_wait = max(10.0 / rate, 2.0) if rate else 2.0
+
+        self._prof_image.add_callback(self._image_collected, index=2)
+        self._prof_image.auto_monitor = True
+        self._restart_collection_timer()
+
+    def _restart_collection_timer(self):
+        """Arm (or push back) the stalled-collection watchdog"""
+        if self._collection_timer:
+            self._collection_timer.cancel()
+
+        self._collection_timer = Timer(self._collection_wait,
+                                       self._collection_timed_out)
+        self._collection_timer.daemon = True
+        self._collection_timer.start()
+
+    def _collection_timed_out(self):
+        """Tear down a collection whose frames stopped arriving so
+        acquire_images can be used again"""
+        self._prof_image.auto_monitor = False
+        self._prof_image.remove_callback(index=2)
+        collected = self._images_requested - self._images_to_collect
+        print(f'{self._prof_name}: image not updating, stopped at '
+              f'{collected} of {self._images_requested}')
+        self._collection_timer = None
+        self._acquire_clbk = None
+        self._gathering_data = False
+
+    def _image_collected(self, pv_name=None, value=None, **kw):
+        """Callback for each image update, stops itself once enough
+        images have been collected"""
+        # The new subscription's initial event carries the frame that was
+        # already current before the request, not a fresh one
+        if self._discard_first:
+            self._discard_first = False
+            self._restart_collection_timer()
+            return
+
+        self._images.append(value)
+        self._images_to_collect -= 1
+        if self._images_to_collect > 0:
+            self._restart_collection_timer()
+            return
+
+        if self._collection_timer:
+            self._collection_timer.cancel()
+            self._collection_timer = None
+        self._prof_image.auto_monitor = False
+        self._prof_image.remove_callback(index=2)
+        if self._acquire_clbk:  # Would want this to be pyqtSignal or Event notification type thing
+            USER_CLBK_POOL.submit(self._acquire_clbk)
+            self._acquire_clbk = None
         self._gathering_data = False
-        return  # No join, waste of a function
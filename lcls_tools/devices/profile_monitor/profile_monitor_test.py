@@ -72,7 +72,7 @@ class ProfileMonitorTest(unittest.TestCase):
         self.assertEqual(inspect.ismethod(p.extract), True)
         self.assertEqual(inspect.ismethod(p._extracted), True)
         self.assertEqual(inspect.ismethod(p.acquire_images), True)
-        self.assertEqual(inspect.ismethod(p._collect_image_data), True)
+        self.assertEqual(inspect.ismethod(p._image_collected), True)
 
     def test_name(self):
         """Test that we get default name and can hand name in init arg"""
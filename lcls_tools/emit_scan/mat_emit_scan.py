@@ -44,8 +44,11 @@ class MatEmitScan(object):
         try:
             data = sio.loadmat(mat_file)['data'][0][0]
             self._fields = data.dtype.names
+            self._field_idx = {name: i for i, name in enumerate(self._fields)}
             self._file = mat_file
             self._status = self._unpack_prop(STAT, data)
+            self._status_list = None
+            self._use_list = None
             self._scan_type = self._unpack_prop(SCAN_TYPE, data)
             self._name = self._unpack_prop(NAME, data)
             self._quad_name = self._unpack_prop(QUAD_NAME, data)
@@ -79,8 +82,10 @@ class MatEmitScan(object):
     @property
     def status(self):
         """Array of 0 or 1, no idea what status it's looking at"""
-        if self._status is not None:
-            return [status[0] for status in self._status]
+        if self._status is not None and self._status_list is None:
+            self._status_list = [status[0] for status in self._status]
+
+        return self._status_list
 
     @property
     def scan_type(self):
@@ -115,8 +120,10 @@ class MatEmitScan(object):
     @property
     def use(self):
         """Array of 1 or 0, 1 means used in calculations"""
-        if self._use is not None:
-            return [use[0] for use in self._use]
+        if self._use is not None and self._use_list is None:
+            self._use_list = [use[0] for use in self._use]
+
+        return self._use_list
 
     @property
     def timestamp(self):
@@ -233,27 +240,24 @@ class MatEmitScan(object):
 
     def _unpack_prop(self, prop, data):
         """General way to pull out specific values for the fields present in data"""
-        if prop not in self._fields:
+        if prop not in self._field_idx:
             return None
 
-        idx = self._fields.index(prop)
-        return data[idx]
+        return data[self._field_idx[prop]]
 
     def _unpack_beam(self, data):
         """Unpacks to a list of lists.  Each list is an iteration which contains
         all the data for each fit.  Each fit is a dictionary with all the associated types of data.
         Also, since beam_std is a duplicate of beam except for stats I just throw the stats in the
         dictionary"""
-        if BEAM not in self._fields:
+        if BEAM not in self._field_idx:
             return None
 
-        idx_beam = self._fields.index(BEAM)
-        beam = data[idx_beam]
+        beam = data[self._field_idx[BEAM]]
 
         beam_std = None
-        if BEAM_STD in self._fields:
-            idx_beam_std = self._fields.index(BEAM_STD)
-            beam_std = data[idx_beam_std]
+        if BEAM_STD in self._field_idx:
+            beam_std = data[self._field_idx[BEAM_STD]]
 
         names = beam.dtype.names
         temp = []
@@ -279,11 +283,10 @@ class MatEmitScan(object):
     def _unpack_twiss_pv(self, data):
         """The other important piece.  All the twiss parameters from the
         emittance scan.  7 vals corresponding to each fit method"""
-        if TWISS_PV not in self._fields:
+        if TWISS_PV not in self._field_idx:
             return None
 
-        idx_twiss_pv = self._fields.index(TWISS_PV)
-        twiss_pv = data[idx_twiss_pv]
+        twiss_pv = data[self._field_idx[TWISS_PV]]
 
         names = twiss_pv.dtype.names
         temp1 = []
@@ -7,13 +7,10 @@
 
 from __future__ import division
 
-from pylab import array, plt, floor, show
-from numpy import argsort, power, exp, zeros
-from scipy.io import loadmat
+from pylab import array, plt, floor
+from numpy import argsort, power, exp, argmax, bincount, flatnonzero, minimum
 from scipy.optimize import curve_fit
 from operator import itemgetter
-from sys import argv, exit
-from time import time
 
 NUM_BUCKS = 10
 DEBUG = False
@@ -23,7 +20,9 @@ DEBUG = False
 # maximum point is in its own bucket (bucket 10), which would break a lot of 
 # shit, so it necessitates the error checking
 def get_bucket(val, step):
-    bucket = int(floor(val / step))
+    # Plain floor division; numpy.floor on a scalar builds a 0-d array
+    # and this runs once per point inside get_runs
+    bucket = int(val // step)
     return bucket if bucket < 10 else 9
 
 
@@ -62,7 +61,7 @@ def gen_gauss_sum(x, *params):
     m = params[0]
     b = params[1]
 
-    y = [m * i + b for i in x]
+    y = m * array(x) + b
 
     for i in range(2, len(params), 3):
         ctr = params[i]
@@ -120,7 +119,7 @@ def find_line(zero_runs, runs, xdata, ydata):
 # largest ones
 def get_peaks(data, num_peaks, runs):
     # Should be doable in preprocessing
-    len_runs = map(lambda run: len(run), runs)
+    len_runs = [len(run) for run in runs]
 
     # User-proofing. Could probably limit input
     num_peaks = num_peaks if num_peaks <= len(runs) else len(runs)
@@ -200,35 +199,24 @@ def get_runs(data, step):
 # A whole rigmarole to collapse multiple pedestals.
 # It assumes that the pedestal is the bucket with the most elements
 def adjust_data(data, step):
-    start = time()
     normalized_adjustment = 0
 
-    bucket_count = zeros(NUM_BUCKS)
-    bucket_contents = [[] for i in xrange(0, NUM_BUCKS)]
-    buckets = zeros(len(data))
+    # Bucket every point in one vectorized pass, clamping the max point
+    # into the last bucket like get_bucket does
+    buckets = minimum(floor(data / step).astype(int), NUM_BUCKS - 1)
+    bucket_count = bincount(buckets, minlength=NUM_BUCKS)
 
-    for idx, element in enumerate(data):
-        bucket = get_bucket(element, step)
-        bucket_count[bucket] += 1
-        bucket_contents[bucket] += [idx]
-        buckets[idx] = bucket
+    zero_bucket = argmax(bucket_count)
+    zero_contents = flatnonzero(buckets == zero_bucket)
 
-    zero_bucket = max(enumerate(bucket_count), key=itemgetter(1))[0]
-
-    needs_adjustment = False
-
-    for idx, bucket in enumerate(buckets):
-        if bucket < zero_bucket:
-            # Inefficient to set this every time, but eh
-            needs_adjustment = True
-            # Sets them arbitrarily to the value of the first element in the
-            # zero bucket, to eliminate the double pedestal
-            data[idx] = data[bucket_contents[zero_bucket][0]]
-
-    if needs_adjustment:
-        normalized_adjustment = min(data[bucket_contents[zero_bucket]])
+    below_zero = buckets < zero_bucket
+    if below_zero.any():
+        # Sets them arbitrarily to the value of the first element in the
+        # zero bucket, to eliminate the double pedestal
+        data[below_zero] = data[zero_contents[0]]
+        normalized_adjustment = data[zero_contents].min()
         data = data - normalized_adjustment
-        step = max(data) / NUM_BUCKS
+        step = data.max() / NUM_BUCKS
 
     return [data, step, normalized_adjustment]
 
@@ -299,8 +287,8 @@ def process_data(data):
 
     # This prints my vertical buckets
     if DEBUG:
-        for i in xrange(1, NUM_BUCKS):
-            plt.plot([i * step for _ in xrange(0, len(data))])
+        for i in range(1, NUM_BUCKS):
+            plt.plot([i * step for _ in range(0, len(data))])
 
     total_adjustment = first_adjustment + normalized_adjustment
 
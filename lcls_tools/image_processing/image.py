@@ -1,6 +1,8 @@
 import numpy as np
 
 class Image(object):
+    __slots__ = ('_image',)
+
     def __init__(self, image):
         if not isinstance(image, np.ndarray):
             raise TypeError('input must be ndarray')
@@ -4,7 +4,6 @@ from scipy.optimize import curve_fit
 from scipy import asarray
 import matplotlib.pyplot as plt
 import fit_gaussian as fg
-from time import time
 
 def fliplr(image):
     """Flip over vertical axis"""
@@ -20,7 +19,7 @@ def center_of_mass(image, sigma=5):
 
 def average_image(images):
     """If we can do things with an average image, do it!"""
-    return sum(images) / len(images)
+    return np.mean(images, axis=0)
 
 def shape_image(image, x_size, y_size):
     """Shape typical returned array, rows x columns so y x x"""
@@ -30,7 +29,7 @@ def x_projection(image, axis=0, subtract_baseline=True):
     """Expects ndarray, return x projection"""
     proj = np.sum(image, axis=0)
     if subtract_baseline:
-        return proj - min(proj)
+        return proj - proj.min()
 
     return proj
 
@@ -38,8 +37,8 @@ def y_projection(image, subtract_baseline=True):
     """Expects ndarray, return y projection"""
     proj = np.sum(image, axis=1)
     if subtract_baseline:
-        return proj - min(proj)
-    
+        return proj - proj.min()
+
     return proj
 
 def gauss_func(x, a, x0, sigma):